@@ -1,16 +1,261 @@
 """AWX API client wrapper with authentication and error handling."""
 
+import asyncio
+import functools
+import hashlib
+import ipaddress
+import math
 import os
+import socket
 import time
-from typing import Dict, List, Optional
-from urllib.parse import urljoin
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
 
-import requests
+import httpx
+import ijson
+import orjson
+
+# Job statuses after which a job's details no longer change
+TERMINAL_JOB_STATUSES = frozenset({"successful", "failed", "canceled", "error"})
+
+# Job listings go stale quickly, so cache them (and prefetched pages) only briefly
+JOB_LIST_CACHE_TTL = 10.0  # seconds
+
+# Where OAuth2 tokens are kept between restarts
+DEFAULT_TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/awx-mcp/token")
+
+# Treat tokens this close to expiry as already expired
+TOKEN_EXPIRY_MARGIN = 60  # seconds
+
+# Responses from tokens/ meaning AWX will not issue this user a token at all
+TOKEN_REFUSED_STATUSES = frozenset({400, 403, 404})
+
+# Gateway errors worth retrying (e.g. AWX web pods restarting behind the load balancer)
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+# ijson events carrying a scalar value
+_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
+_MISSING = object()
+
+T = TypeVar("T")
 
 
 class AWXClientError(Exception):
     """Base exception for AWX client errors."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """
+        Initialise error.
+
+        Args:
+            message: Human-readable error message
+            status_code: HTTP status code, if the error came from an AWX response
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TTLCache:
+    """In-process cache with per-entry expiry and LRU eviction."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """
+        Initialise cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return a cached value, or default if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds this entry stays valid (default: the cache TTL)
+        """
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Drop an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _AsyncByteReader:
+    """Adapt an async iterator of byte chunks to the async read() ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        """
+        Initialise reader.
+
+        Args:
+            chunks: Async iterator of byte chunks, e.g. httpx Response.aiter_bytes()
+        """
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next non-empty chunk, or b"" once the stream is exhausted."""
+        # ijson probes with read(0) to detect bytes vs str; don't consume a chunk for it
+        if size == 0:
+            return b""
+        # Decompression can yield empty chunks, which ijson would take for EOF
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class _CachingResolverTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that reuses resolved addresses for new connections.
+
+    httpx resolves the host name on every new connection and has no resolver
+    hook, so the lookup is done here and the request sent to the address,
+    keeping the original name for the Host header and TLS verification (SNI).
+    """
+
+    def __init__(self, ttl: float, **kwargs):
+        """
+        Initialise transport.
+
+        Args:
+            ttl: Seconds to reuse a resolved address
+            **kwargs: Arguments for httpx.AsyncHTTPTransport
+        """
+        self._transport = httpx.AsyncHTTPTransport(**kwargs)
+        self._addresses = TTLCache(maxsize=64, ttl=ttl)
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """Return the cached addresses for host, resolving it if needed."""
+        addresses = self._addresses.get((host, port))
+        if addresses is None:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+            self._addresses.set((host, port), addresses)
+        return addresses
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send the request to the cached addresses of its host.
+
+        Like a plain connect, each address is tried in turn until one accepts
+        the connection; the one that did is tried first from then on.
+        """
+        host = request.url.host
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            return await self._transport.handle_async_request(request)
+
+        port = request.url.port or (443 if request.url.scheme == "https" else 80)
+        try:
+            addresses = await self._resolve(host, port)
+        except OSError as e:
+            raise httpx.ConnectError(f"Cannot resolve {host}: {e}", request=request)
+
+        url = request.url
+        request.extensions = {**request.extensions, "sni_hostname": host}
+        candidates = list(addresses)
+        for i, address in enumerate(candidates):
+            request.url = url.copy_with(host=address)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.ConnectError:
+                # Nothing was sent, so the next address can safely be tried
+                if i == len(candidates) - 1:
+                    # The addresses may have moved (e.g. AWX failed over); resolve again next time
+                    self._addresses.pop((host, port))
+                    raise
+                continue
+
+            if i and address in addresses:
+                addresses.remove(address)
+                addresses.insert(0, address)
+            return response
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        await self._transport.aclose()
+
+
+def _cached(when: Optional[Callable[[Any], bool]] = None, ttl: Optional[float] = None) -> Callable:
+    """
+    Cache an AWXClient coroutine method's result in the client's TTL cache.
+
+    None results (e.g. lookups that found nothing) are never cached. Callers
+    can pass fresh=True to skip the cached value; the new result is still cached.
+
+    Args:
+        when: Optional predicate; the result is only cached if it returns True
+        ttl: Seconds to cache results (default: the cache TTL)
+
+    Returns:
+        Method decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self: "AWXClient", *args, fresh: bool = False, **kwargs) -> Any:
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            value = _MISSING if fresh else self.cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            value = await func(self, *args, **kwargs)
+            if value is not None and (when is None or when(value)):
+                self.cache.set(key, value, ttl=ttl)
+            return value
+
+        return wrapper
+
+    return decorator
 
 
 class AWXClient:
@@ -22,6 +267,14 @@ class AWXClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         timeout: int = 30,
+        max_concurrent_pages: int = 8,
+        cache_ttl: float = 60.0,
+        cache_maxsize: int = 1024,
+        dns_cache_ttl: float = 300.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.3,
+        use_token: bool = True,
+        token_cache_path: Optional[str] = DEFAULT_TOKEN_CACHE_PATH,
     ):
         """
         Initialise AWX client.
@@ -31,77 +284,500 @@ class AWXClient:
             username: AWX username
             password: AWX password
             timeout: Request timeout in seconds
+            max_concurrent_pages: Maximum page requests in flight when exhausting a listing
+            cache_ttl: Seconds to cache idempotent lookups
+            cache_maxsize: Maximum number of cached lookups
+            dns_cache_ttl: Seconds to reuse a resolved AWX address for new connections
+            max_retries: Retries for GET requests failing with a gateway or connection error
+            retry_backoff: Base delay in seconds, doubled on each retry
+            use_token: Exchange the password for a read-scoped OAuth2 token on first use
+            token_cache_path: File to keep tokens in across restarts (None to disable)
         """
         self.base_url = (base_url or os.getenv("AWX_URL", "")).rstrip("/")
         self.username = username or os.getenv("AWX_USERNAME")
         self.password = password or os.getenv("AWX_PASSWORD")
         self.timeout = timeout
+        self.max_concurrent_pages = max_concurrent_pages
+        self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self.dns_cache_ttl = dns_cache_ttl
+        self._prefetch_tasks: Set[asyncio.Task] = set()
+        self._fields_supported = True
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.use_token = use_token
+        self.token_cache_path = token_cache_path
+        self._token: Optional[str] = None
+        self._token_id: Optional[int] = None
+        self._token_unavailable = False
+        self._token_lock = asyncio.Lock()
 
         if not all([self.base_url, self.username, self.password]):
             raise AWXClientError(
                 "Missing required credentials. Set AWX_URL, AWX_USERNAME, and AWX_PASSWORD environment variables."
             )
 
-        self.api_base = urljoin(self.base_url, "/api/v2/")
-        self.session = requests.Session()
-        self.session.auth = (self.username, self.password)
-        self.session.headers.update({"Content-Type": "application/json"})
+        self.api_base = f"{self.base_url}/api/v2/"
+        self.client = httpx.AsyncClient(
+            auth=(self.username, self.password),
+            transport=_CachingResolverTransport(
+                ttl=self.dns_cache_ttl,
+                http2=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=75),
+            ),
+            timeout=self.timeout,
+            # br is only decoded when brotli is installed (httpx[brotli])
+            headers={"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate, br"},
+        )
+
+    async def close(self) -> None:
+        """Cancel outstanding prefetches, revoke the token in use and close the underlying HTTP client."""
+        for task in self._prefetch_tasks:
+            task.cancel()
+        if self._token is not None:
+            # Tokens never expire by default, so don't leave one behind per server start
+            await self._revoke_token(self._token, self._token_id)
+        await self.client.aclose()
+
+    def _token_cache_key(self) -> str:
+        """Return the token cache key for this AWX instance and user."""
+        return hashlib.sha256(f"{self.base_url}|{self.username}".encode()).hexdigest()
+
+    def _read_token_cache(self) -> Dict:
+        """
+        Read the token cache file.
+
+        Returns:
+            Mapping of cache key to token entry (empty if missing or unreadable)
+        """
+        if not self.token_cache_path:
+            return {}
+        try:
+            with open(self.token_cache_path, "rb") as f:
+                entries = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write_token_cache(self, entries: Dict) -> None:
+        """
+        Write the token cache file, readable by the current user only.
+
+        Args:
+            entries: Mapping of cache key to token entry
+        """
+        if not self.token_cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.token_cache_path), mode=0o700, exist_ok=True)
+            fd = os.open(self.token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(entries))
+        except OSError:
+            pass
+
+    def _load_cached_token(self) -> Optional[Dict]:
+        """
+        Return the cached token entry for this AWX instance and user if still valid.
+
+        Returns:
+            Dictionary with the token, its expiry and its AWX ID, or None
+        """
+        entry = self._read_token_cache().get(self._token_cache_key())
+        if not isinstance(entry, dict) or not entry.get("token"):
+            return None
+
+        expires = entry.get("expires")
+        if expires:
+            try:
+                expires_at = datetime.fromisoformat(expires.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                return None
+            if expires_at - TOKEN_EXPIRY_MARGIN <= time.time():
+                return None
+
+        return entry
+
+    def _store_cached_token(self, entry: Dict) -> None:
+        """
+        Save this AWX instance and user's token to the cache file.
+
+        Args:
+            entry: Dictionary with the token, its expiry and its AWX ID
+        """
+        entries = self._read_token_cache()
+        entries[self._token_cache_key()] = entry
+        self._write_token_cache(entries)
+
+    def _forget_cached_token(self, token: str) -> None:
+        """
+        Remove a token from the cache file, unless it was already replaced.
+
+        Args:
+            token: Token string to remove
+        """
+        entries = self._read_token_cache()
+        entry = entries.get(self._token_cache_key())
+        if isinstance(entry, dict) and entry.get("token") == token:
+            del entries[self._token_cache_key()]
+            self._write_token_cache(entries)
+
+    async def _create_token(self) -> Optional[Dict]:
+        """
+        Create a read-scoped OAuth2 personal access token using basic auth.
+
+        Returns:
+            Dictionary with the token, its expiry and its AWX ID, or None if
+            AWX refuses to issue tokens to this user
+
+        Raises:
+            AWXClientError: If no token could be obtained this time (network or server error)
+        """
+        try:
+            response = await self.client.post(
+                self.api_base + "tokens/",
+                auth=(self.username, self.password),
+                json={"description": "awx-mcp-server", "scope": "read"},
+            )
+        except httpx.HTTPError as e:
+            raise AWXClientError(f"Token request failed: {str(e)}")
+        if response.status_code in TOKEN_REFUSED_STATUSES:
+            return None
+        if response.status_code != 201:
+            raise AWXClientError(f"Token request failed: HTTP {response.status_code}", response.status_code)
+
+        try:
+            data = self._parse_json(response)
+        except AWXClientError:
+            return None
+        if not data.get("token"):
+            return None
+
+        entry = {"token": data["token"], "expires": data.get("expires"), "id": data.get("id")}
+        await asyncio.to_thread(self._store_cached_token, entry)
+        return entry
+
+    async def _revoke_token(self, token: str, token_id: Optional[int]) -> None:
+        """
+        Delete a token from AWX and the cache file.
+
+        Best effort: failures are ignored, as the token is no longer used either way.
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        Args:
+            token: Token string
+            token_id: AWX ID of the token (None if unknown, e.g. cached by an older version)
+        """
+        await asyncio.to_thread(self._forget_cached_token, token)
+        if token_id is None:
+            return
+        try:
+            await self.client.delete(self.api_base + f"tokens/{token_id}/", auth=(self.username, self.password))
+        except httpx.HTTPError:
+            pass
+
+    async def _ensure_token(self) -> None:
+        """
+        Switch the client to bearer token auth, obtaining a token if needed.
+
+        Falls back to basic auth for the rest of the session if AWX refuses to
+        issue a token (e.g. OAuth2 disabled for external users). If AWX cannot
+        be reached or fails, only the current request uses basic auth and the
+        next one tries again.
+        """
+        if self._token is not None or self._token_unavailable:
+            return
+
+        async with self._token_lock:
+            if self._token is not None or self._token_unavailable:
+                return
+
+            # File access runs in a worker thread so other tool calls are not held up
+            try:
+                entry = await asyncio.to_thread(self._load_cached_token) or await self._create_token()
+            except AWXClientError:
+                # e.g. VPN not up yet or AWX restarting; not a reason to give up on tokens
+                return
+            if entry is None:
+                self._token_unavailable = True
+                return
+
+            self._token = entry["token"]
+            self._token_id = entry.get("id")
+            self.client.auth = None
+            self.client.headers["Authorization"] = f"Bearer {self._token}"
+
+    async def _discard_token(self, token: str) -> None:
+        """
+        Revoke a token AWX rejected and revert to basic auth until a new one is issued.
+
+        Args:
+            token: The rejected token
+        """
+        if self._token != token:
+            return
+
+        token_id = self._token_id
+        self._token = None
+        self._token_id = None
+        self.client.headers.pop("Authorization", None)
+        self.client.auth = (self.username, self.password)
+        await self._revoke_token(token, token_id)
+
+    def _prefetch(self, fetch: Callable[..., Awaitable[Any]], *args) -> None:
+        """
+        Warm the cache for a page the caller is likely to ask for next.
+
+        Runs in the background; failures are ignored since nobody is waiting
+        on the result.
+
+        Args:
+            fetch: Cached coroutine method to call
+            *args: Arguments for fetch, matching how the caller will request it
+        """
+        async def run() -> None:
+            try:
+                await fetch(*args)
+            except AWXClientError:
+                pass
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    @asynccontextmanager
+    async def _stream(self, method: str, endpoint: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed HTTP request to AWX API.
+
+        The response body is not read up front, so callers can consume it
+        incrementally. GET requests are retried with exponential backoff on
+        gateway errors (502/503/504) and dropped connections, as long as no
+        part of the body has been handed to the caller yet. A request rejected
+        with 401 while using a token is repeated once with a fresh token.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (relative to /api/v2/)
+            **kwargs: Additional arguments for httpx
+
+        Yields:
+            Response object with an unread body
+
+        Raises:
+            AWXClientError: On request failure
+        """
+        url = self.api_base + endpoint.lstrip("/")
+        retries = self.max_retries if method == "GET" else 0
+        attempt = 0
+        reauthenticated = False
+
+        while True:
+            if self.use_token:
+                await self._ensure_token()
+            token = self._token
+
+            streaming = False
+            try:
+                async with self.client.stream(method, url, **kwargs) as response:
+                    if response.status_code == 401 and token is not None and not reauthenticated:
+                        # Token revoked or expired server-side; get a new one
+                        reauthenticated = True
+                        await self._discard_token(token)
+                        continue
+                    if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                        if response.status_code >= 400:
+                            await response.aread()
+                            self._raise_for_status(response.status_code, response.text, endpoint)
+
+                        streaming = True
+                        yield response
+                        return
+            except httpx.TimeoutException:
+                raise AWXClientError(f"Request timeout after {self.timeout}s")
+            except (httpx.NetworkError, httpx.RemoteProtocolError):
+                if attempt >= retries or streaming:
+                    raise AWXClientError(f"Cannot connect to AWX at {self.base_url}")
+            except httpx.HTTPError as e:
+                raise AWXClientError(f"Request failed: {str(e)}")
+
+            attempt += 1
+            await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+    async def _request(self, method: str, endpoint: str, as_text: bool = False, **kwargs) -> Any:
         """
         Make HTTP request to AWX API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (relative to /api/v2/)
-            **kwargs: Additional arguments for requests
+            as_text: Return the raw response body instead of parsed JSON
+            **kwargs: Additional arguments for httpx
 
         Returns:
-            Response object
+            Parsed JSON response (or response text if as_text is set)
 
         Raises:
             AWXClientError: On request failure
         """
-        url = urljoin(self.api_base, endpoint.lstrip("/"))
-        kwargs.setdefault("timeout", self.timeout)
+        async with self._stream(method, endpoint, **kwargs) as response:
+            await response.aread()
+
+        if as_text:
+            return response.text
+        return self._parse_json(response)
+
+    async def _with_fields(self, fetch: Callable[[Dict], Awaitable[T]], params: Dict, fields: str) -> T:
+        """
+        Run a list request, asking AWX to return only the given fields.
+
+        AWX releases that reject the fields parameter answer with HTTP 400; the
+        request is then repeated without it and pruning is disabled for the
+        rest of the session.
+
+        Args:
+            fetch: Coroutine function performing the request with the given query parameters
+            params: Query parameters
+            fields: Comma-separated field names to return
+
+        Returns:
+            Result of fetch
+        """
+        if not self._fields_supported:
+            return await fetch(params)
 
         try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            if status_code == 404:
-                raise AWXClientError(f"Resource not found: {endpoint}")
-            elif status_code == 401:
-                raise AWXClientError("Authentication failed - check credentials")
-            elif status_code == 403:
-                raise AWXClientError("Permission denied - insufficient privileges")
-            elif status_code >= 500:
-                raise AWXClientError(f"AWX server error: {e.response.text[:200]}")
-            else:
-                raise AWXClientError(f"HTTP {status_code}: {e.response.text[:200]}")
-        except requests.exceptions.ConnectionError:
-            raise AWXClientError(f"Cannot connect to AWX at {self.base_url}")
-        except requests.exceptions.Timeout:
-            raise AWXClientError(f"Request timeout after {self.timeout}s")
-        except requests.exceptions.RequestException as e:
-            raise AWXClientError(f"Request failed: {str(e)}")
-
-    def get_job(self, job_id: int) -> Dict:
+            return await fetch({**params, "fields": fields})
+        except AWXClientError as e:
+            if e.status_code != 400:
+                raise
+
+        result = await fetch(params)
+        self._fields_supported = False
+        return result
+
+    async def _list(self, endpoint: str, params: Dict, fields: str) -> Dict:
+        """
+        GET a list endpoint, asking AWX to return only the given fields.
+
+        Args:
+            endpoint: API endpoint (relative to /api/v2/)
+            params: Query parameters
+            fields: Comma-separated field names to return
+
+        Returns:
+            Parsed JSON response
+        """
+        return await self._with_fields(lambda p: self._request("GET", endpoint, params=p), params, fields)
+
+    async def _stream_results(self, endpoint: str, params: Dict, keys: Tuple[str, ...]) -> Tuple[int, bool, List[Dict]]:
+        """
+        GET a list endpoint and parse it incrementally as it downloads.
+
+        Only the scalar values of keys are kept from each result, so nested
+        blobs such as summary_fields are skipped without ever being built and
+        the full page is never held in memory.
+
+        Args:
+            endpoint: API endpoint (relative to /api/v2/)
+            params: Query parameters
+            keys: Result keys to keep
+
+        Returns:
+            Tuple of (total count, whether a next page exists, pruned results)
+
+        Raises:
+            AWXClientError: On request failure or malformed JSON
+        """
+        item_keys = {f"results.item.{key}": key for key in keys}
+        count = 0
+        has_next = False
+        results: List[Dict] = []
+        item: Dict = {}
+
+        async with self._stream("GET", endpoint, params=params) as response:
+            try:
+                async for prefix, event, value in ijson.parse_async(
+                    _AsyncByteReader(response.aiter_bytes()), use_float=True
+                ):
+                    if prefix == "results.item":
+                        if event == "start_map":
+                            item = {}
+                        elif event == "end_map":
+                            results.append(item)
+                    elif event in _SCALAR_EVENTS:
+                        key = item_keys.get(prefix)
+                        if key is not None:
+                            item[key] = value
+                        elif prefix == "count":
+                            count = value
+                        elif prefix == "next":
+                            has_next = value is not None
+            except ijson.JSONError as e:
+                raise AWXClientError(f"Invalid JSON from AWX: {str(e)}")
+
+        return count, has_next, results
+
+    @staticmethod
+    def _parse_json(response: httpx.Response) -> Any:
+        """
+        Parse a JSON response body.
+
+        Uses orjson straight from the raw bytes, which is markedly faster than
+        the stdlib parser on large listings and skips the intermediate str decode.
+
+        Args:
+            response: Response with a fully read body
+
+        Returns:
+            Parsed JSON
+
+        Raises:
+            AWXClientError: If the body is not valid JSON
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise AWXClientError(f"Invalid JSON from AWX: {str(e)}")
+
+    @staticmethod
+    def _raise_for_status(status_code: int, body: str, endpoint: str) -> None:
+        """
+        Translate an HTTP error status into an AWXClientError.
+
+        Args:
+            status_code: HTTP status code
+            body: Response body text
+            endpoint: API endpoint that was requested
+
+        Raises:
+            AWXClientError: Always
+        """
+        if status_code == 404:
+            raise AWXClientError(f"Resource not found: {endpoint}", status_code)
+        elif status_code == 401:
+            raise AWXClientError("Authentication failed - check credentials", status_code)
+        elif status_code == 403:
+            raise AWXClientError("Permission denied - insufficient privileges", status_code)
+        elif status_code >= 500:
+            raise AWXClientError(f"AWX server error: {body[:200]}", status_code)
+        else:
+            raise AWXClientError(f"HTTP {status_code}: {body[:200]}", status_code)
+
+    @_cached(when=lambda job: job.get("status") in TERMINAL_JOB_STATUSES)
+    async def get_job(self, job_id: int) -> Dict:
         """
         Get job details.
 
+        Finished jobs are cached; running or pending jobs are always fetched live.
+
         Args:
             job_id: Job ID
 
         Returns:
             Job details dictionary
         """
-        response = self._request("GET", f"jobs/{job_id}/")
-        return response.json()
+        return await self._request("GET", f"jobs/{job_id}/")
 
-    def get_job_stdout(self, job_id: int, format: str = "txt", start_line: int = 0) -> str:
+    async def get_job_stdout(self, job_id: int, format: str = "txt", start_line: int = 0) -> str:
         """
         Get job stdout/logs.
 
@@ -117,13 +793,35 @@ class AWXClient:
         if start_line > 0:
             params["start_line"] = start_line
 
-        response = self._request("GET", f"jobs/{job_id}/stdout/", params=params)
-        return response.text
+        return await self._request("GET", f"jobs/{job_id}/stdout/", as_text=True, params=params)
 
-    def list_inventories(self, page: int = 1, page_size: int = 50) -> Dict:
+    async def stream_job_stdout(self, job_id: int, format: str = "txt", start_line: int = 0) -> AsyncIterator[str]:
+        """
+        Stream job stdout/logs line by line without buffering the whole log.
+
+        Args:
+            job_id: Job ID
+            format: Output format (txt, ansi, json, html)
+            start_line: Starting line number (for pagination)
+
+        Yields:
+            Job output lines, without line endings
+        """
+        params = {"format": format}
+        if start_line > 0:
+            params["start_line"] = start_line
+
+        async with self._stream("GET", f"jobs/{job_id}/stdout/", params=params) as response:
+            async for line in response.aiter_lines():
+                yield line
+
+    async def list_inventories(self, page: int = 1, page_size: int = 200) -> Dict:
         """
         List available inventories.
 
+        The following page is prefetched in the background, so paging through
+        inventories in order is served from the cache.
+
         Args:
             page: Page number
             page_size: Results per page
@@ -131,11 +829,19 @@ class AWXClient:
         Returns:
             Paginated inventory list
         """
+        data = await self._list_inventories_page(page, page_size)
+        if data.get("next"):
+            self._prefetch(self._list_inventories_page, page + 1, page_size)
+        return data
+
+    @_cached()
+    async def _list_inventories_page(self, page: int, page_size: int) -> Dict:
+        """Fetch one page of inventories."""
         params = {"page": page, "page_size": page_size}
-        response = self._request("GET", "inventories/", params=params)
-        return response.json()
+        return await self._list("inventories/", params, "id,name,total_hosts,description")
 
-    def get_inventory(self, inventory_id: int) -> Dict:
+    @_cached()
+    async def get_inventory(self, inventory_id: int) -> Dict:
         """
         Get inventory details.
 
@@ -145,10 +851,9 @@ class AWXClient:
         Returns:
             Inventory details dictionary
         """
-        response = self._request("GET", f"inventories/{inventory_id}/")
-        return response.json()
+        return await self._request("GET", f"inventories/{inventory_id}/")
 
-    def get_inventory_hosts(self, inventory_id: int) -> List[Dict]:
+    async def get_inventory_hosts(self, inventory_id: int) -> List[Dict]:
         """
         Get all hosts in an inventory.
 
@@ -156,25 +861,41 @@ class AWXClient:
             inventory_id: Inventory ID
 
         Returns:
-            List of host dictionaries
+            List of host dictionaries (id, name, enabled, description)
         """
-        all_hosts = []
-        page = 1
-        page_size = 200
+        endpoint = f"inventories/{inventory_id}/hosts/"
+        keys = ("id", "name", "enabled", "description")
+        page_size = 500
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
 
-        while True:
-            params = {"page": page, "page_size": page_size}
-            response = self._request("GET", f"inventories/{inventory_id}/hosts/", params=params)
-            data = response.json()
-            all_hosts.extend(data["results"])
+        async def fetch_page(page: int) -> Tuple[int, bool, List[Dict]]:
+            # Large inventories produce multi-megabyte pages, so parse them as they stream in
+            return await self._with_fields(
+                lambda p: self._stream_results(endpoint, p, keys),
+                {"page": page, "page_size": page_size},
+                ",".join(keys),
+            )
+
+        async def fetch(page: int) -> List[Dict]:
+            async with semaphore:
+                _, _, results = await fetch_page(page)
+            return results
 
-            if not data.get("next"):
-                break
-            page += 1
+        # First page tells us how many pages remain
+        count, has_next, all_hosts = await fetch_page(1)
+        if not has_next or not all_hosts:
+            return all_hosts
+
+        # AWX may clamp page_size, so size the fan-out on what it actually returned
+        total_pages = math.ceil(count / len(all_hosts))
+        pages = await asyncio.gather(*[fetch(page) for page in range(2, total_pages + 1)])
+        for results in pages:
+            all_hosts.extend(results)
 
         return all_hosts
 
-    def get_host(self, host_id: int) -> Dict:
+    @_cached()
+    async def get_host(self, host_id: int) -> Dict:
         """
         Get host details.
 
@@ -184,10 +905,9 @@ class AWXClient:
         Returns:
             Host details dictionary
         """
-        response = self._request("GET", f"hosts/{host_id}/")
-        return response.json()
+        return await self._request("GET", f"hosts/{host_id}/")
 
-    def get_host_variables(self, host_id: int) -> Dict:
+    async def get_host_variables(self, host_id: int) -> Dict:
         """
         Get host variables.
 
@@ -197,10 +917,36 @@ class AWXClient:
         Returns:
             Host variables dictionary
         """
-        response = self._request("GET", f"hosts/{host_id}/variable_data/")
-        return response.json()
+        return await self._request("GET", f"hosts/{host_id}/variable_data/")
 
-    def search_job_templates(self, name_filter: Optional[str] = None, limit: int = 50) -> List[Dict]:
+    @staticmethod
+    def inline_host_variables(host: Dict) -> Optional[Dict]:
+        """
+        Parse the variables embedded in a host record.
+
+        Host details and host listings carry variables as a JSON or YAML
+        string, which saves a round-trip to variable_data/ when it is JSON.
+
+        Args:
+            host: Host dictionary as returned by AWX
+
+        Returns:
+            Host variables dictionary, or None if absent or not JSON
+        """
+        raw = host.get("variables")
+        if raw is None:
+            return None
+        if not raw.strip():
+            return {}
+
+        try:
+            variables = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return None
+        return variables if isinstance(variables, dict) else None
+
+    @_cached()
+    async def search_job_templates(self, name_filter: Optional[str] = None, limit: int = 200) -> List[Dict]:
         """
         Search job templates.
 
@@ -215,29 +961,43 @@ class AWXClient:
         if name_filter:
             params["name__icontains"] = name_filter
 
-        response = self._request("GET", "job_templates/", params=params)
-        return response.json()["results"]
+        data = await self._list("job_templates/", params, "id,name,playbook,description")
+        return data["results"]
 
-    def list_jobs(self, status: Optional[str] = None, limit: int = 20, order_by: str = "-id") -> List[Dict]:
+    async def list_jobs(
+        self, status: Optional[str] = None, limit: int = 200, order_by: str = "-id", page: int = 1
+    ) -> List[Dict]:
         """
         List recent jobs.
 
+        The following page is prefetched in the background, so paging through
+        jobs in order is served from the cache.
+
         Args:
             status: Filter by status (successful, failed, running, etc.)
             limit: Maximum results to return
             order_by: Sort field (default: -id for newest first)
+            page: Page number, each page holding up to limit jobs
 
         Returns:
             List of job dictionaries
         """
-        params = {"page_size": limit, "order_by": order_by}
+        data = await self._list_jobs_page(status, limit, order_by, page)
+        if data.get("next"):
+            self._prefetch(self._list_jobs_page, status, limit, order_by, page + 1)
+        return data["results"]
+
+    @_cached(ttl=JOB_LIST_CACHE_TTL)
+    async def _list_jobs_page(self, status: Optional[str], limit: int, order_by: str, page: int) -> Dict:
+        """Fetch one page of jobs."""
+        params = {"page": page, "page_size": limit, "order_by": order_by}
         if status:
             params["status"] = status
 
-        response = self._request("GET", "jobs/", params=params)
-        return response.json()["results"]
+        return await self._list("jobs/", params, "id,name,status,started,finished")
 
-    def find_inventory_by_name(self, name: str) -> Optional[Dict]:
+    @_cached()
+    async def find_inventory_by_name(self, name: str) -> Optional[Dict]:
         """
         Find inventory by name (exact match).
 
@@ -247,11 +1007,12 @@ class AWXClient:
         Returns:
             Inventory dictionary or None if not found
         """
-        response = self._request("GET", "inventories/", params={"name": name})
-        results = response.json()["results"]
+        data = await self._request("GET", "inventories/", params={"name": name})
+        results = data["results"]
         return results[0] if results else None
 
-    def find_host_by_name(self, name: str) -> Optional[Dict]:
+    @_cached()
+    async def find_host_by_name(self, name: str) -> Optional[Dict]:
         """
         Find host by name (exact match).
 
@@ -259,8 +1020,8 @@ class AWXClient:
             name: Host name
 
         Returns:
-            Host dictionary or None if not found
+            Host dictionary (including its raw variables string) or None if not found
         """
-        response = self._request("GET", "hosts/", params={"name": name})
-        results = response.json()["results"]
+        data = await self._request("GET", "hosts/", params={"name": name})
+        results = data["results"]
         return results[0] if results else None
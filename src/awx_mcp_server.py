@@ -1,177 +1,193 @@
 #!/usr/bin/env python3
 """AWX MCP Server - Model Context Protocol server for AWX API using official Python SDK."""
 
-import json
+import asyncio
+import functools
+import os
 import sys
-import time
-from typing import Optional
-
-from mcp.server.fastmcp import FastMCP
-
-from awx_client import AWXClient, AWXClientError
-
-# Status emoji mapping
-STATUS_EMOJI = {
-    "successful": "✅",
-    "failed": "❌",
-    "running": "🔄",
-    "pending": "⏳",
-    "canceled": "🚫",
-    "error": "💥",
-}
-
-# Initialise AWX client from environment variables
-try:
-    awx_client = AWXClient()
-except AWXClientError as e:
-    sys.stderr.write(f"Failed to initialise AWX client: {e}\n")
-    sys.stderr.flush()
-    raise
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-# Create FastMCP server
-mcp = FastMCP("awx-mcp-server")
+from mcp.server.fastmcp import Context, FastMCP
 
+from awx_client import TERMINAL_JOB_STATUSES, AWXClient, AWXClientError
 
-@mcp.tool()
-def awx_get_job_status(job_id: int) -> str:
+# Log follow polling: start fast, back off while the job is quiet
+POLL_INTERVAL_MIN = 0.5  # seconds
+POLL_INTERVAL_MAX = 15.0  # seconds
+POLL_BACKOFF = 1.5
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> AWXClient:
     """
-    Get the status and details of an AWX job.
+    Return the shared AWX client, creating it on first use.
 
-    Args:
-        job_id: The AWX job ID to query
+    Created lazily so the server starts even when the environment is
+    incomplete; tools then report the configuration error per call.
 
     Returns:
-        Formatted job status with emoji and details
+        AWX client configured from environment variables
+
+    Raises:
+        AWXClientError: If required environment variables are missing
     """
+    return AWXClient()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the AWX HTTP client when the server shuts down."""
     try:
-        job = awx_client.get_job(job_id)
+        yield
+    finally:
+        if get_client.cache_info().currsize:
+            await get_client().close()
 
-        # Format key details
-        status = job.get("status", "unknown")
-        name = job.get("name", "N/A")
-        started = job.get("started", "N/A")
-        finished = job.get("finished", "N/A")
-        elapsed = job.get("elapsed", 0)
-        job_type = job.get("type", "N/A")
 
-        # Status emoji
-        emoji = STATUS_EMOJI.get(status, "❓")
+# Create FastMCP server
+mcp = FastMCP("awx-mcp-server", lifespan=lifespan)
 
-        output = f"""{emoji} Job {job_id}: {name}
 
-**Status**: {status}
-**Type**: {job_type}
-**Started**: {started}
-**Finished**: {finished}
-**Elapsed**: {elapsed:.1f}s
+@mcp.tool()
+async def awx_get_job_status(job_id: int) -> Dict[str, Any]:
+    """
+    Get the status and details of an AWX job.
 
-**Related Resources**:
-- Job Template ID: {job.get('job_template', 'N/A')}
-- Inventory ID: {job.get('inventory', 'N/A')}
-- Project: {job.get('project', 'N/A')}
-"""
+    Args:
+        job_id: The AWX job ID to query
 
-        return output
+    Returns:
+        Job status, timings and related resource IDs
+    """
+    try:
+        awx_client = get_client()
+        job = await awx_client.get_job(job_id)
+
+        return {
+            "id": job_id,
+            "name": job.get("name"),
+            "status": job.get("status", "unknown"),
+            "type": job.get("type"),
+            "started": job.get("started"),
+            "finished": job.get("finished"),
+            "elapsed": job.get("elapsed", 0),
+            "job_template": job.get("job_template"),
+            "inventory": job.get("inventory"),
+            "project": job.get("project"),
+        }
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 @mcp.tool()
-def awx_stream_job_logs(job_id: int, follow: bool = False) -> str:
+async def awx_stream_job_logs(job_id: int, ctx: Context, follow: bool = False) -> Dict[str, Any]:
     """
     Stream or retrieve job execution logs.
 
     Args:
         job_id: The AWX job ID to retrieve logs for
+        ctx: MCP request context, used to send new output as it arrives
         follow: If true, poll for new output until job completes (default: false)
 
     Returns:
-        Job stdout logs
+        Job stdout logs (and final job status when following)
     """
     try:
+        awx_client = get_client()
         if not follow:
             # Simple case: return complete logs immediately
-            logs = awx_client.get_job_stdout(job_id, format="txt")
-            return logs
+            logs = await awx_client.get_job_stdout(job_id, format="txt")
+            return {"job_id": job_id, "stdout": logs}
 
         # Polling case: stream logs as they arrive
         output_lines = []
         start_line = 0
-        poll_interval = 2  # seconds
-
-        while True:
-            # Get job status
-            job = awx_client.get_job(job_id)
-            status = job.get("status")
+        poll_interval = POLL_INTERVAL_MIN
 
-            # Get new log lines
-            logs = awx_client.get_job_stdout(job_id, format="txt", start_line=start_line)
-            new_lines = logs.splitlines()
+        async def fetch_new_lines() -> List[str]:
+            nonlocal start_line
+            # Streamed rather than buffered as one string
+            new_lines = [
+                line async for line in awx_client.stream_job_stdout(job_id, format="txt", start_line=start_line)
+            ]
 
-            # Track progress
+            # Track progress and forward new output to the client straight away
             if new_lines:
                 output_lines.extend(new_lines)
                 start_line += len(new_lines)
+                await ctx.info("\n".join(new_lines))
+            return new_lines
 
-            # Check if job finished
-            if status in ["successful", "failed", "canceled", "error"]:
-                break
-
-            # Continue polling
-            time.sleep(poll_interval)
+        while True:
+            if await fetch_new_lines():
+                # Job is producing output, so it is still running; skip the status check
+                poll_interval = POLL_INTERVAL_MIN
+            else:
+                # Quiet stretch: check whether the job has finished
+                job = await awx_client.get_job(job_id)
+                status = job.get("status")
+                if status in TERMINAL_JOB_STATUSES:
+                    # Pick up anything written between the last poll and completion
+                    await fetch_new_lines()
+                    break
+                poll_interval = min(poll_interval * POLL_BACKOFF, POLL_INTERVAL_MAX)
+
+            await asyncio.sleep(poll_interval)
 
         # Return complete output
-        full_output = "\n".join(output_lines)
-        return full_output
+        return {"job_id": job_id, "status": status, "stdout": "\n".join(output_lines)}
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 @mcp.tool()
-def awx_list_inventories(page: int = 1, page_size: int = 50) -> str:
+async def awx_list_inventories(page: int = 1, page_size: int = 200) -> Dict[str, Any]:
     """
     List available AWX inventories.
 
     Args:
         page: Page number (default: 1)
-        page_size: Results per page (default: 50)
+        page_size: Results per page (default: 200, the AWX maximum)
 
     Returns:
-        Formatted list of inventories with host counts
+        Total inventory count and this page of inventories with host counts
     """
     try:
-        data = awx_client.list_inventories(page, page_size)
-        inventories = data["results"]
-
-        # Format output
-        lines = [f"📦 Found {data['count']} inventories (showing page {page}):\n"]
-
-        for inv in inventories:
-            inv_id = inv["id"]
-            name = inv["name"]
-            hosts_count = inv.get("total_hosts", 0)
-            desc = inv.get("description", "")
-            lines.append(f"- **{name}** (ID: {inv_id}) - {hosts_count} hosts")
-            if desc:
-                lines.append(f"  {desc}")
-
-        output = "\n".join(lines)
-        return output
+        awx_client = get_client()
+        data = await awx_client.list_inventories(page, page_size)
+
+        return {
+            "count": data["count"],
+            "page": page,
+            "has_next": bool(data.get("next")),
+            "inventories": [
+                {
+                    "id": inv["id"],
+                    "name": inv["name"],
+                    "total_hosts": inv.get("total_hosts", 0),
+                    "description": inv.get("description", ""),
+                }
+                for inv in data["results"]
+            ],
+        }
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 @mcp.tool()
-def awx_get_inventory_hosts(inventory_id: Optional[int] = None, inventory_name: Optional[str] = None) -> str:
+async def awx_get_inventory_hosts(
+    inventory_id: Optional[int] = None, inventory_name: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Get all hosts in an AWX inventory.
 
@@ -180,47 +196,56 @@ def awx_get_inventory_hosts(inventory_id: Optional[int] = None, inventory_name:
         inventory_name: Inventory name (use this OR inventory_id)
 
     Returns:
-        Formatted list of hosts in the inventory
+        Inventory name and ID with the list of its hosts
     """
     try:
-        # Resolve inventory ID
+        awx_client = get_client()
+
+        # Resolve inventory and get hosts
         if inventory_id is not None:
-            inventory = awx_client.get_inventory(inventory_id)
+            # Inventory details are only needed for the name, so fetch them alongside the hosts
+            tasks = [
+                asyncio.ensure_future(awx_client.get_inventory(inventory_id)),
+                asyncio.ensure_future(awx_client.get_inventory_hosts(inventory_id)),
+            ]
+            try:
+                inventory, hosts = await asyncio.gather(*tasks)
+            except BaseException:
+                # gather leaves the other task running; don't page through hosts nobody will see
+                for task in tasks:
+                    task.cancel()
+                raise
         elif inventory_name is not None:
-            inventory = awx_client.find_inventory_by_name(inventory_name)
+            inventory = await awx_client.find_inventory_by_name(inventory_name)
             if not inventory:
-                return f"❌ Inventory not found: {inventory_name}"
+                return {"error": f"Inventory not found: {inventory_name}"}
             inventory_id = inventory["id"]
+            hosts = await awx_client.get_inventory_hosts(inventory_id)
         else:
-            return "❌ Must provide inventory_id or inventory_name"
-
-        # Get hosts
-        hosts = awx_client.get_inventory_hosts(inventory_id)
-
-        # Format output
-        lines = [f"🖥️ Hosts in inventory '{inventory['name']}' (ID: {inventory_id}):\n"]
-        lines.append(f"Total hosts: {len(hosts)}\n")
-
-        for host in hosts:
-            host_id = host["id"]
-            name = host["name"]
-            enabled = "✅" if host.get("enabled", True) else "❌"
-            desc = host.get("description", "")
-            lines.append(f"{enabled} **{name}** (ID: {host_id})")
-            if desc:
-                lines.append(f"  {desc}")
-
-        output = "\n".join(lines)
-        return output
+            return {"error": "Must provide inventory_id or inventory_name"}
+
+        return {
+            "inventory": {"id": inventory_id, "name": inventory["name"]},
+            "count": len(hosts),
+            "hosts": [
+                {
+                    "id": host["id"],
+                    "name": host["name"],
+                    "enabled": host.get("enabled", True),
+                    "description": host.get("description", ""),
+                }
+                for host in hosts
+            ],
+        }
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 @mcp.tool()
-def awx_get_host_variables(host_id: Optional[int] = None, host_name: Optional[str] = None) -> str:
+async def awx_get_host_variables(host_id: Optional[int] = None, host_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Get variables for a specific host.
 
@@ -229,131 +254,114 @@ def awx_get_host_variables(host_id: Optional[int] = None, host_name: Optional[st
         host_name: Host FQDN (use this OR host_id)
 
     Returns:
-        Host variables formatted as JSON
+        Host name and ID with its variables
     """
     try:
-        # Resolve host ID
+        awx_client = get_client()
+
+        # Resolve host ID, bypassing the cache as the record carries the variables
         if host_id is not None:
-            host = awx_client.get_host(host_id)
+            host = await awx_client.get_host(host_id, fresh=True)
         elif host_name is not None:
-            host = awx_client.find_host_by_name(host_name)
+            host = await awx_client.find_host_by_name(host_name, fresh=True)
             if not host:
-                return f"❌ Host not found: {host_name}"
+                return {"error": f"Host not found: {host_name}"}
             host_id = host["id"]
         else:
-            return "❌ Must provide host_id or host_name"
-
-        # Get variables
-        variables = awx_client.get_host_variables(host_id)
+            return {"error": "Must provide host_id or host_name"}
 
-        # Format output
-        lines = [f"🔧 Variables for host '{host['name']}' (ID: {host_id}):\n"]
-        lines.append("```json")
-        lines.append(json.dumps(variables, indent=2))
-        lines.append("```")
+        # Get variables, using the copy embedded in the host record when it is JSON
+        variables = awx_client.inline_host_variables(host)
+        if variables is None:
+            variables = await awx_client.get_host_variables(host_id)
 
-        output = "\n".join(lines)
-        return output
+        return {"host": {"id": host_id, "name": host["name"]}, "variables": variables}
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 @mcp.tool()
-def awx_search_job_templates(name_filter: Optional[str] = None, limit: int = 50) -> str:
+async def awx_search_job_templates(name_filter: Optional[str] = None, limit: int = 200) -> Dict[str, Any]:
     """
     Search for AWX job templates.
 
     Args:
         name_filter: Filter by template name (substring match)
-        limit: Maximum results to return (default: 50)
+        limit: Maximum results to return (default: 200)
 
     Returns:
-        Formatted list of job templates with playbook information
+        Matching job templates with playbook information
     """
     try:
-        templates = awx_client.search_job_templates(name_filter, limit)
-
-        # Format output
-        if name_filter:
-            lines = [f"🔍 Job templates matching '{name_filter}':\n"]
-        else:
-            lines = ["📋 Available job templates:\n"]
-
-        lines.append(f"Found {len(templates)} templates\n")
-
-        for tmpl in templates:
-            tmpl_id = tmpl["id"]
-            name = tmpl["name"]
-            playbook = tmpl.get("playbook", "N/A")
-            desc = tmpl.get("description", "")
-            lines.append(f"- **{name}** (ID: {tmpl_id})")
-            lines.append(f"  Playbook: `{playbook}`")
-            if desc:
-                lines.append(f"  {desc}")
-
-        output = "\n".join(lines)
-        return output
+        awx_client = get_client()
+        templates = await awx_client.search_job_templates(name_filter, limit)
+
+        return {
+            "name_filter": name_filter,
+            "count": len(templates),
+            "templates": [
+                {
+                    "id": tmpl["id"],
+                    "name": tmpl["name"],
+                    "playbook": tmpl.get("playbook"),
+                    "description": tmpl.get("description", ""),
+                }
+                for tmpl in templates
+            ],
+        }
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 @mcp.tool()
-def awx_list_recent_jobs(status: Optional[str] = None, limit: int = 20) -> str:
+async def awx_list_recent_jobs(status: Optional[str] = None, limit: int = 200, page: int = 1) -> Dict[str, Any]:
     """
     List recent AWX job executions.
 
     Args:
         status: Filter by status (successful, failed, running, pending, canceled, error)
-        limit: Maximum results to return (default: 20)
+        limit: Maximum results to return (default: 200)
+        page: Page number, for jobs older than the first `limit` (default: 1)
 
     Returns:
-        Formatted list of recent jobs with status emoji
+        Recent jobs, newest first, with status and timings
     """
     try:
-        jobs = awx_client.list_jobs(status, limit)
-
-        # Format output
-        if status:
-            lines = [f"📜 Recent jobs with status '{status}':\n"]
-        else:
-            lines = ["📜 Recent jobs:\n"]
-
-        lines.append(f"Showing {len(jobs)} jobs\n")
-
-        for job in jobs:
-            job_id = job["id"]
-            name = job["name"]
-            job_status = job.get("status", "unknown")
-            started = job.get("started", "N/A")
-            finished = job.get("finished", "N/A")
-
-            emoji = STATUS_EMOJI.get(job_status, "❓")
-
-            lines.append(f"{emoji} **Job {job_id}**: {name}")
-            lines.append(f"  Status: {job_status}")
-            lines.append(f"  Started: {started}")
-            if finished != "N/A":
-                lines.append(f"  Finished: {finished}")
-
-        output = "\n".join(lines)
-        return output
+        awx_client = get_client()
+        jobs = await awx_client.list_jobs(status, limit, page=page)
+
+        return {
+            "status": status,
+            "page": page,
+            "count": len(jobs),
+            "jobs": [
+                {
+                    "id": job["id"],
+                    "name": job["name"],
+                    "status": job.get("status", "unknown"),
+                    "started": job.get("started"),
+                    "finished": job.get("finished"),
+                }
+                for job in jobs
+            ],
+        }
 
     except AWXClientError as e:
-        return f"AWX Error: {str(e)}"
+        return {"error": f"AWX Error: {str(e)}"}
     except Exception as e:
-        return f"Unexpected error: {str(e)}"
+        return {"error": f"Unexpected error: {str(e)}"}
 
 
 def main():
     """Main entry point."""
     sys.stderr.write("AWX MCP Server starting...\n")
-    sys.stderr.write(f"Connected to AWX at {awx_client.base_url}\n")
+    sys.stderr.write(f"Using AWX at {os.getenv('AWX_URL') or '(AWX_URL not set)'}\n")
     sys.stderr.flush()
 
     # Run server with stdio transport (default)
@@ -0,0 +1,74 @@
+"""Tests for the AWX API client."""
+
+import asyncio
+import os
+import socket
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from awx_client import AWXClient  # noqa: E402
+
+JOB_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 30\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b'{"id": 1, "status": "running"}'
+)
+
+
+class ResolverFallbackTest(unittest.IsolatedAsyncioTestCase):
+    """The cached resolver must try every address, like a plain connect does."""
+
+    async def asyncSetUp(self):
+        self.requests = 0
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await reader.readuntil(b"\r\n\r\n")
+            self.requests += 1
+            writer.write(JOB_RESPONSE)
+            await writer.drain()
+            writer.close()
+
+        # Only the second address of awx.test is listening
+        self.server = await asyncio.start_server(handle, "127.0.0.2", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+        async def getaddrinfo(host, port, **kwargs):
+            return [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.2", port)),
+            ]
+
+        self.lookups = mock.AsyncMock(side_effect=getaddrinfo)
+        patcher = mock.patch.object(asyncio.get_running_loop(), "getaddrinfo", self.lookups)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = AWXClient(f"http://awx.test:{self.port}", "user", "pass", use_token=False, max_retries=0)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_dead_first_address_falls_back_to_next(self):
+        job = await self.client.get_job(1)
+
+        self.assertEqual(job["status"], "running")
+        self.assertEqual(self.requests, 1)
+
+    async def test_working_address_is_remembered(self):
+        await self.client.get_job(1)
+        await self.client.get_job(2)
+
+        self.assertEqual(self.requests, 2)
+        self.assertEqual(self.lookups.await_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()